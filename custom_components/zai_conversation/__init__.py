@@ -8,8 +8,12 @@ import logging
 import anthropic
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_API_KEY,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .assistant_memory import AssistantMemory
@@ -56,6 +60,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ZaiConfigEntry) -> bool:
         MEMORY_KEY: memory,
     }
 
+    async def _async_flush_memory(_event: Event) -> None:
+        """Flush pending memory writes before Home Assistant stops."""
+        await memory.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_flush_memory)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -70,7 +82,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
             memory = hass.data[DOMAIN][entry.entry_id].get(MEMORY_KEY)
             if memory:
-                await memory.async_save()
+                await memory.async_shutdown()
             hass.data[DOMAIN].pop(entry.entry_id)
 
         # Clean up domain data if empty
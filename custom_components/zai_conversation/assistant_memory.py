@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
+import time
+import unicodedata
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 # Memory categories
@@ -21,6 +31,86 @@ CATEGORY_NOTE = "note"
 CATEGORY_ROUTINE = "routine"
 CATEGORY_CONTEXT = "context"
 
+# Delay before a scheduled save is flushed to disk, in seconds
+SAVE_DELAY = 1.0
+
+
+# Last formatted timestamp, reused while the wall-clock second is unchanged
+_last_iso_sec: int = 0
+_last_iso_str: str = ""
+
+
+def _utcnow_iso_and_ts() -> tuple[str, int]:
+    """Return the current UTC time as an ISO string and a Unix epoch.
+
+    The ISO string is cached and reused for calls within the same second.
+    """
+    global _last_iso_sec, _last_iso_str
+
+    now = time.time()
+    sec = int(now)
+    if sec != _last_iso_sec:
+        _last_iso_sec = sec
+        _last_iso_str = dt_util.utc_from_timestamp(now).isoformat()
+    return _last_iso_str, sec
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as an ISO string, cached per second."""
+    return _utcnow_iso_and_ts()[0]
+
+
+def _norm(text: str) -> str:
+    """Normalize text into a case-insensitive comparison key."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode a JSON document from raw bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON bytes.
+
+    The memory file is only ever read back by this module, so no
+    indentation is emitted.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_file(path: Path, payload: bytes) -> tuple[int, int]:
+    """Write a memory file and return its (mtime_ns, size) signature.
+
+    Runs in the executor.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a sibling temp file and swap it in, so readers never see
+    # a partially written file
+    tmp_path = path.with_suffix(".json.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # os.write may write fewer bytes than requested
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
 
 class AssistantMemory:
     """Manage persistent memory for the assistant."""
@@ -48,46 +138,174 @@ class AssistantMemory:
             },
         }
         self._loaded = False
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._save_lock = asyncio.Lock()
+        self._pref_keys: set[str] = set()
+        self._version = 0
+        self._file_signature: tuple[int, int] | None = None
 
     async def async_load(self) -> None:
         """Load memory from storage."""
-        if self._loaded:
-            return
+        if not self._loaded:
+            await self._async_load_impl()
+
+    async def _async_load_impl(self) -> None:
+        """Load memory from storage unconditionally.
 
+        Hot paths check _loaded inline before awaiting this, so no
+        coroutine is created once memory is loaded.
+        """
         try:
-            if self._storage_path.exists():
-                data = await self.hass.async_add_executor_job(
-                    self._read_file
-                )
-                if data:
-                    self._data = data
-                    _LOGGER.debug("Loaded memory for entry %s", self.entry_id)
+            result = await self._async_read_storage()
         except Exception as err:
             _LOGGER.error("Error loading memory: %s", err)
+        else:
+            if self._apply_storage(result):
+                _LOGGER.debug("Loaded memory for entry %s", self.entry_id)
 
+        self._rebuild_index()
+        self._version += 1
         self._loaded = True
 
-    def _read_file(self) -> dict[str, Any] | None:
-        """Read memory file (runs in executor)."""
+    async def async_reload_if_changed(self) -> None:
+        """Reload memory from storage if the file changed on disk."""
+        if not self._loaded:
+            await self._async_load_impl()
+            return
+
+        # Pending local changes take precedence over the file contents
+        if self._dirty:
+            return
+
+        version = self._version
         try:
-            with open(self._storage_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            result = await self._async_read_storage()
+        except Exception as err:
+            _LOGGER.error("Error reloading memory: %s", err)
+            return
+
+        # A mutation landed while the file was being read; keep it
+        if self._version != version or self._dirty:
+            return
+
+        if self._apply_storage(result):
+            self._rebuild_index()
+            self._version += 1
+            _LOGGER.debug("Reloaded memory for entry %s", self.entry_id)
+
+    async def _async_read_storage(
+        self,
+    ) -> tuple[tuple[int, int], dict[str, Any] | None] | None:
+        """Read the storage file without touching the in-memory state."""
+        return await self.hass.async_add_executor_job(
+            self._read_file, self._file_signature
+        )
+
+    def _apply_storage(
+        self, result: tuple[tuple[int, int], dict[str, Any] | None] | None
+    ) -> bool:
+        """Adopt a storage read result, returning True if data was replaced."""
+        if result is None:
+            return False
+
+        self._file_signature, data = result
+        if not data:
+            return False
+
+        self._data = data
+        return True
+
+    def _rebuild_index(self) -> None:
+        """Backfill normalized keys and rebuild the in-memory indexes."""
+        stats = self._data["stats"]
+        stats["frequent_commands"] = Counter(stats.get("frequent_commands", {}))
+        for entry in (*self._data["preferences"], *self._data["notes"]):
+            if "_key" not in entry:
+                entry["_key"] = _norm(entry["text"])
+        self._pref_keys = {p["_key"] for p in self._data["preferences"]}
+
+    def _read_file(
+        self, known_signature: tuple[int, int] | None = None
+    ) -> tuple[tuple[int, int], dict[str, Any] | None] | None:
+        """Read memory file (runs in executor).
+
+        Returns None if the file is missing or its (mtime_ns, size) signature
+        matches known_signature.
+        """
+        try:
+            fd = os.open(self._storage_path, os.O_RDONLY)
+        except FileNotFoundError:
             return None
 
-    async def async_save(self) -> None:
-        """Save memory to storage."""
         try:
-            await self.hass.async_add_executor_job(self._write_file)
-            _LOGGER.debug("Saved memory for entry %s", self.entry_id)
-        except Exception as err:
-            _LOGGER.error("Error saving memory: %s", err)
+            st = os.fstat(fd)
+            signature = (st.st_mtime_ns, st.st_size)
+            if signature == known_signature:
+                return None
+            # Read the raw bytes and let the parser decode them; os.read may
+            # return short, so loop until st_size bytes or EOF
+            chunks = []
+            remaining = st.st_size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            raw = b"".join(chunks)
+        finally:
+            os.close(fd)
+
+        try:
+            return signature, _json_loads(raw)
+        except ValueError:
+            return signature, None
+
+    def _schedule_save(self) -> None:
+        """Mark memory as changed and schedule a coalesced save."""
+        self._version += 1
+        self._dirty = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = self.hass.loop.call_later(SAVE_DELAY, self._flush_callback)
+
+    @callback
+    def _flush_callback(self) -> None:
+        """Flush pending changes once the save delay has elapsed."""
+        self._flush_handle = None
+        self.hass.async_create_task(self.async_save())
 
-    def _write_file(self) -> None:
-        """Write memory file (runs in executor)."""
-        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._storage_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, ensure_ascii=False)
+    async def async_save(self) -> None:
+        """Save memory to storage."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._save_lock:
+            self._dirty = False
+            try:
+                payload = _json_dumps(self._data)
+                self._file_signature = await self.hass.async_add_executor_job(
+                    _write_file, self._storage_path, payload
+                )
+                _LOGGER.debug("Saved memory for entry %s", self.entry_id)
+            except Exception as err:
+                self._dirty = True
+                _LOGGER.error("Error saving memory: %s", err)
+
+    async def async_shutdown(self) -> None:
+        """Flush any pending changes to storage."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # Wait for a save that is already in flight
+        async with self._save_lock:
+            pass
+
+        if self._dirty:
+            await self.async_save()
 
     # =========================================================================
     # Preferences
@@ -101,33 +319,44 @@ class AssistantMemory:
             - "Non mi piace la musica alta"
             - "Svegliami sempre alle 7"
         """
-        await self.async_load()
+        if not self._loaded:
+            await self._async_load_impl()
+
+        # Avoid duplicates
+        key = _norm(preference)
+        if key in self._pref_keys:
+            return
 
         entry = {
             "text": preference,
+            "_key": key,
             "category": category,
-            "added": dt_util.utcnow().isoformat(),
+            "added": _utcnow_iso(),
         }
 
-        # Avoid duplicates
-        existing = [p["text"].lower() for p in self._data["preferences"]]
-        if preference.lower() not in existing:
-            self._data["preferences"].append(entry)
-            await self.async_save()
-            _LOGGER.info("Added preference: %s", preference)
+        self._data["preferences"].append(entry)
+        self._pref_keys.add(key)
+        self._schedule_save()
+        _LOGGER.info("Added preference: %s", preference)
 
     async def remove_preference(self, preference_text: str) -> bool:
         """Remove a preference by text (partial match)."""
-        await self.async_load()
-
-        initial_len = len(self._data["preferences"])
-        self._data["preferences"] = [
-            p for p in self._data["preferences"]
-            if preference_text.lower() not in p["text"].lower()
-        ]
-
-        if len(self._data["preferences"]) < initial_len:
-            await self.async_save()
+        if not self._loaded:
+            await self._async_load_impl()
+
+        query = _norm(preference_text)
+        keep: list[dict[str, Any]] = []
+        removed = False
+        for pref in self._data["preferences"]:
+            if query in pref["_key"]:
+                self._pref_keys.discard(pref["_key"])
+                removed = True
+            else:
+                keep.append(pref)
+
+        if removed:
+            self._data["preferences"] = keep
+            self._schedule_save()
             return True
         return False
 
@@ -146,30 +375,34 @@ class AssistantMemory:
             - "Ricordami che domani viene l'idraulico"
             - "Il codice dell'allarme è 1234"
         """
-        await self.async_load()
+        if not self._loaded:
+            await self._async_load_impl()
 
         entry = {
             "text": note,
+            "_key": _norm(note),
             "tags": tags or [],
-            "added": dt_util.utcnow().isoformat(),
+            "added": _utcnow_iso(),
         }
 
         self._data["notes"].append(entry)
-        await self.async_save()
+        self._schedule_save()
         _LOGGER.info("Added note: %s", note)
 
     async def remove_note(self, note_text: str) -> bool:
         """Remove a note by text (partial match)."""
-        await self.async_load()
+        if not self._loaded:
+            await self._async_load_impl()
 
+        query = _norm(note_text)
         initial_len = len(self._data["notes"])
         self._data["notes"] = [
             n for n in self._data["notes"]
-            if note_text.lower() not in n["text"].lower()
+            if query not in n["_key"]
         ]
 
         if len(self._data["notes"]) < initial_len:
-            await self.async_save()
+            self._schedule_save()
             return True
         return False
 
@@ -188,12 +421,13 @@ class AssistantMemory:
             - set_context("user_name", "Simone")
             - set_context("wake_time", "07:00")
         """
-        await self.async_load()
+        if not self._loaded:
+            await self._async_load_impl()
         self._data["context"][key] = {
             "value": value,
-            "updated": dt_util.utcnow().isoformat(),
+            "updated": _utcnow_iso(),
         }
-        await self.async_save()
+        self._schedule_save()
 
     def get_context(self, key: str, default: Any = None) -> Any:
         """Get a context value."""
@@ -210,22 +444,27 @@ class AssistantMemory:
 
     async def record_interaction(self, command: str | None = None) -> None:
         """Record an interaction for stats."""
-        await self.async_load()
+        if not self._loaded:
+            await self._async_load_impl()
 
         self._data["stats"]["total_interactions"] += 1
-        self._data["stats"]["last_interaction"] = dt_util.utcnow().isoformat()
+        now_iso, now_ts = _utcnow_iso_and_ts()
+        self._data["stats"]["last_interaction"] = now_iso
+        self._data["stats"]["last_interaction_ts"] = now_ts
 
         if command:
             cmd_lower = command.lower()
-            freq = self._data["stats"]["frequent_commands"]
-            freq[cmd_lower] = freq.get(cmd_lower, 0) + 1
-
-            # Keep only top 20 commands
-            if len(freq) > 20:
-                sorted_cmds = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-                self._data["stats"]["frequent_commands"] = dict(sorted_cmds[:20])
+            freq: Counter[str] = self._data["stats"]["frequent_commands"]
+            freq[cmd_lower] += 1
+
+            # Keep only top 20 commands, trimming once the table doubles
+            # so the cost is amortized over many interactions
+            if len(freq) > 40:
+                self._data["stats"]["frequent_commands"] = Counter(
+                    dict(freq.most_common(20))
+                )
 
-        await self.async_save()
+        self._schedule_save()
 
     def get_stats(self) -> dict[str, Any]:
         """Get usage statistics."""
@@ -241,44 +480,53 @@ class AssistantMemory:
         Returns:
             Formatted string with user preferences, notes, and context.
         """
-        parts = []
-
         # User context
+        context_sect = ""
         context = self.get_all_context()
         if context:
-            parts.append("### Informazioni Utente")
-            for key, value in context.items():
-                # Make key human-readable
-                readable_key = key.replace("_", " ").title()
-                parts.append(f"- {readable_key}: {value}")
-
-        # Preferences
+            # Make keys human-readable
+            context_sect = "### Informazioni Utente\n" + "\n".join(
+                f"- {key.replace('_', ' ').title()}: {value}"
+                for key, value in context.items()
+            )
+
+        # Preferences (last 10)
+        pref_sect = ""
         preferences = self.get_preferences()
         if preferences:
-            parts.append("\n### Preferenze Utente")
-            for pref in preferences[-10:]:  # Last 10 preferences
-                parts.append(f"- {pref['text']}")
+            pref_sect = "### Preferenze Utente\n" + "\n".join(
+                f"- {pref['text']}" for pref in preferences[-10:]
+            )
 
-        # Notes
+        # Notes (last 5)
+        note_sect = ""
         notes = self.get_notes()
         if notes:
-            parts.append("\n### Note da Ricordare")
-            for note in notes[-5:]:  # Last 5 notes
-                parts.append(f"- {note['text']}")
+            note_sect = "### Note da Ricordare\n" + "\n".join(
+                f"- {note['text']}" for note in notes[-5:]
+            )
 
         # Stats summary
+        stats_sect = ""
         stats = self.get_stats()
         if stats.get("total_interactions", 0) > 0:
-            parts.append(f"\n### Statistiche")
-            parts.append(f"- Interazioni totali: {stats['total_interactions']}")
-            if stats.get("last_interaction"):
+            stats_sect = f"### Statistiche\n- Interazioni totali: {stats['total_interactions']}"
+            last = None
+            if stats.get("last_interaction_ts"):
+                last = dt_util.utc_from_timestamp(stats["last_interaction_ts"])
+            elif stats.get("last_interaction"):
+                # Memory files written before the epoch timestamp was stored
                 try:
                     last = datetime.fromisoformat(stats["last_interaction"])
-                    parts.append(f"- Ultima interazione: {last.strftime('%d/%m/%Y %H:%M')}")
                 except ValueError:
                     pass
+            if last is not None:
+                stats_sect += f"\n- Ultima interazione: {last.strftime('%d/%m/%Y %H:%M')}"
 
-        return "\n".join(parts) if parts else ""
+        # Blank line between sections
+        return "\n\n".join(
+            filter(None, (context_sect, pref_sect, note_sect, stats_sect))
+        )
 
     # =========================================================================
     # Cleanup
@@ -298,11 +546,17 @@ class AssistantMemory:
                 "frequent_commands": {},
             },
         }
-        await self.async_save()
+        self._rebuild_index()
+        self._schedule_save()
         _LOGGER.info("Cleared memory for entry %s", self.entry_id)
 
     async def async_delete_storage(self) -> None:
         """Delete storage file."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._dirty = False
+
         try:
             if self._storage_path.exists():
                 await self.hass.async_add_executor_job(self._storage_path.unlink)
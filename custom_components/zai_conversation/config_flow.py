@@ -69,13 +69,62 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
-RECOMMENDED_OPTIONS = {
+RECOMMENDED_OPTIONS = MappingProxyType({
     CONF_LLM_HASS_API: "assist",
     CONF_RECOMMENDED: True,
     CONF_PERSONALITY: DEFAULT[CONF_PERSONALITY],
     CONF_MEMORY_ENABLED: DEFAULT[CONF_MEMORY_ENABLED],
     CONF_USE_CUSTOM_PROMPT: DEFAULT[CONF_USE_CUSTOM_PROMPT],
-}
+})
+
+# Options flow selectors that do not depend on runtime state
+_PERSONALITY_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        mode=SelectSelectorMode.DROPDOWN,
+        options=[
+            {"value": PERSONALITY_FORMAL, "label": "Formale"},
+            {"value": PERSONALITY_FRIENDLY, "label": "Amichevole"},
+            {"value": PERSONALITY_CONCISE, "label": "Conciso"},
+        ],
+        translation_key=CONF_PERSONALITY,
+    )
+)
+
+_LLM_API_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        mode=SelectSelectorMode.DROPDOWN,
+        options=["none", "assist", "intent"],
+    )
+)
+
+_CHAT_MODEL_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        mode=SelectSelectorMode.DROPDOWN,
+        # The selector schema only accepts lists
+        options=list(MODELS),
+        custom_value=True,
+    )
+)
+
+_MAX_TOKENS_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=1,
+        max=8000,
+        mode=NumberSelectorMode.BOX,
+    )
+)
+
+_TEMPERATURE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=1,
+        step=0.05,
+        mode=NumberSelectorMode.SLIDER,
+    )
+)
+
+_BOOLEAN_SELECTOR = BooleanSelector()
+_TEMPLATE_SELECTOR = TemplateSelector()
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
@@ -150,7 +199,7 @@ class ZaiConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title="z.ai",
                     data=user_input,
-                    options=RECOMMENDED_OPTIONS,
+                    options=dict(RECOMMENDED_OPTIONS),
                 )
 
         return self.async_show_form(
@@ -186,17 +235,7 @@ class ZaiOptionsFlowHandler(OptionsFlow):
                 CONF_PERSONALITY,
                 default=options.get(CONF_PERSONALITY, DEFAULT[CONF_PERSONALITY]),
             )
-        ] = SelectSelector(
-            SelectSelectorConfig(
-                mode=SelectSelectorMode.DROPDOWN,
-                options=[
-                    {"value": PERSONALITY_FORMAL, "label": "Formale"},
-                    {"value": PERSONALITY_FRIENDLY, "label": "Amichevole"},
-                    {"value": PERSONALITY_CONCISE, "label": "Conciso"},
-                ],
-                translation_key=CONF_PERSONALITY,
-            )
-        )
+        ] = _PERSONALITY_SELECTOR
 
         # Memory toggle
         schema_dict[
@@ -204,7 +243,7 @@ class ZaiOptionsFlowHandler(OptionsFlow):
                 CONF_MEMORY_ENABLED,
                 default=options.get(CONF_MEMORY_ENABLED, DEFAULT[CONF_MEMORY_ENABLED]),
             )
-        ] = BooleanSelector()
+        ] = _BOOLEAN_SELECTOR
 
         # Use custom prompt toggle
         schema_dict[
@@ -212,11 +251,11 @@ class ZaiOptionsFlowHandler(OptionsFlow):
                 CONF_USE_CUSTOM_PROMPT,
                 default=options.get(CONF_USE_CUSTOM_PROMPT, DEFAULT[CONF_USE_CUSTOM_PROMPT]),
             )
-        ] = BooleanSelector()
+        ] = _BOOLEAN_SELECTOR
 
         # Custom prompt template (only shown if use_custom_prompt is True, but always available)
         schema_dict[vol.Optional(CONF_PROMPT, default=options.get(CONF_PROMPT, ""))] = (
-            TemplateSelector()
+            _TEMPLATE_SELECTOR
         )
 
         # LLM API selector
@@ -225,19 +264,14 @@ class ZaiOptionsFlowHandler(OptionsFlow):
                 CONF_LLM_HASS_API,
                 default=options.get(CONF_LLM_HASS_API, "assist"),
             )
-        ] = SelectSelector(
-            SelectSelectorConfig(
-                mode=SelectSelectorMode.DROPDOWN,
-                options=["none", "assist", "intent"],
-            )
-        )
+        ] = _LLM_API_SELECTOR
 
         schema_dict[
             vol.Optional(
                 CONF_RECOMMENDED,
                 default=options.get(CONF_RECOMMENDED, True),
             )
-        ] = BooleanSelector()
+        ] = _BOOLEAN_SELECTOR
 
         return self.async_show_form(
             step_id="init",
@@ -271,40 +305,15 @@ class ZaiOptionsFlowHandler(OptionsFlow):
                 vol.Required(
                     CONF_CHAT_MODEL,
                     default=options.get(CONF_CHAT_MODEL, DEFAULT[CONF_CHAT_MODEL]),
-                ): (
-                    SelectSelector(
-                        SelectSelectorConfig(
-                            mode=SelectSelectorMode.DROPDOWN,
-                            options=MODELS,
-                            custom_value=True,
-                        )
-                    )
-                ),
+                ): _CHAT_MODEL_SELECTOR,
                 vol.Optional(
                     CONF_MAX_TOKENS,
                     default=options.get(CONF_MAX_TOKENS, DEFAULT[CONF_MAX_TOKENS]),
-                ): (
-                    NumberSelector(
-                        NumberSelectorConfig(
-                            min=1,
-                            max=8000,
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    )
-                ),
+                ): _MAX_TOKENS_SELECTOR,
                 vol.Optional(
                     CONF_TEMPERATURE,
                     default=options.get(CONF_TEMPERATURE, DEFAULT[CONF_TEMPERATURE]),
-                ): (
-                    NumberSelector(
-                        NumberSelectorConfig(
-                            min=0,
-                            max=1,
-                            step=0.05,
-                            mode=NumberSelectorMode.SLIDER,
-                        )
-                    )
-                ),
+                ): _TEMPERATURE_SELECTOR,
                 vol.Optional(
                     CONF_AREA_FILTER,
                     default=options.get(CONF_AREA_FILTER, DEFAULT[CONF_AREA_FILTER]),
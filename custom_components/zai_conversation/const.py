@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "zai_conversation"
@@ -37,7 +38,7 @@ PERSONALITY_OPTIONS: Final = [
 # Default values
 DEFAULT_BASE_URL: Final = "https://api.z.ai/api/anthropic"
 
-DEFAULT: Final = {
+DEFAULT: Final = MappingProxyType({
     CONF_CHAT_MODEL: "glm-4.7",
     CONF_MAX_TOKENS: 3000,
     CONF_TEMPERATURE: 0.7,  # Lowered from 1.0 for more consistent device control
@@ -46,17 +47,17 @@ DEFAULT: Final = {
     CONF_MEMORY_ENABLED: True,
     CONF_AREA_FILTER: [],  # Empty = all areas
     CONF_USE_CUSTOM_PROMPT: True,  # Use our optimized prompt by default
-}
+})
 
 # Available GLM-4 models
-MODELS: Final = [
+MODELS: Final = (
     "glm-4.7",
     "glm-4-flash",
     "glm-4-plus",
     "glm-4-air",
     "glm-4-airx",
     "glm-4-long",
-]
+)
 
 # Subentry types
 SUBENTRY_CONVERSATION: Final = "conversation"
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 import logging
 import re
-from typing import Any, Literal
+from typing import Any, Final, Literal
 
 import anthropic
 from anthropic.types import (
@@ -46,6 +46,9 @@ _LOGGER = logging.getLogger(__name__)
 
 MAX_TOOL_ITERATIONS = 10
 
+# Shared cache_control for system prompt blocks; never mutated
+_EPHEMERAL_CACHE: Final = {"type": "ephemeral"}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -76,13 +79,19 @@ def _format_tool(
 
 def _convert_content(
     chat_content: Iterable[conversation.Content],
+    messages: list[MessageParam] | None = None,
 ) -> list[MessageParam]:
     """Transform HA chat_log content into z.ai/Anthropic API format.
 
+    If messages is given, the content is appended to it in place (merging
+    with its last message where roles match) so already converted content
+    does not need to be converted again.
+
     NOTE: SystemContent is skipped here - it is handled separately
     via the 'system' parameter of the API call.
     """
-    messages: list[MessageParam] = []
+    if messages is None:
+        messages = []
 
     for content in chat_content:
         # Skip SystemContent - handled separately
@@ -125,18 +134,17 @@ def _convert_content(
 
             # Add tool uses
             if content.tool_calls:
-                for tool_call in content.tool_calls:
-                    tool_name = getattr(tool_call, "tool_name", None) or getattr(tool_call, "name", "unknown")
-                    tool_args = getattr(tool_call, "tool_args", None) or getattr(tool_call, "args", {})
-                    tool_id = getattr(tool_call, "id", "unknown")
-                    messages[-1]["content"].append(
+                messages[-1]["content"].extend(
+                    [
                         {
                             "type": "tool_use",
-                            "id": tool_id,
-                            "name": tool_name,
-                            "input": tool_args,
+                            "id": getattr(tool_call, "id", "unknown"),
+                            "name": getattr(tool_call, "tool_name", None) or getattr(tool_call, "name", "unknown"),
+                            "input": getattr(tool_call, "tool_args", None) or getattr(tool_call, "args", {}),
                         }
-                    )
+                        for tool_call in content.tool_calls
+                    ]
+                )
 
         elif isinstance(content, conversation.ToolResultContent):
             # Tool result - group with existing user message or create new one
@@ -171,12 +179,12 @@ async def _process_message(
     agent_id: str,
 ) -> None:
     """Transform a z.ai message into HA conversation content."""
-    content_text = ""
+    text_parts: list[str] = []
     assistant_added = False
 
     for block in message.content:
         if block.type == "text":
-            content_text += block.text
+            text_parts.append(block.text)
         elif block.type == "tool_use":
             async for _ in chat_log.async_add_assistant_content(
                 conversation.AssistantContent(
@@ -193,7 +201,7 @@ async def _process_message(
                 pass
             assistant_added = True
 
-    if content_text:
+    if content_text := "".join(text_parts):
         chat_log.async_add_assistant_content_without_tools(
             conversation.AssistantContent(content=content_text, agent_id=agent_id)
         )
@@ -270,6 +278,11 @@ class ZaiConversationEntity(
         self._memory = memory
         self._device_builder = DeviceContextBuilder(hass)
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to Home Assistant."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._device_builder.async_setup())
+
     @property
     def supported_languages(self) -> list[str] | Literal["*"]:
         """Return supported languages."""
@@ -372,7 +385,7 @@ class ZaiConversationEntity(
                     TextBlockParam(
                         type="text",
                         text=custom_prompt,
-                        cache_control={"type": "ephemeral"},
+                        cache_control=_EPHEMERAL_CACHE,
                     )
                 ]
 
@@ -382,7 +395,7 @@ class ZaiConversationEntity(
                         TextBlockParam(
                             type="text",
                             text=ha_system_text,
-                            cache_control={"type": "ephemeral"},
+                            cache_control=_EPHEMERAL_CACHE,
                         )
                     )
             else:
@@ -392,7 +405,7 @@ class ZaiConversationEntity(
                         TextBlockParam(
                             type="text",
                             text=ha_system_text,
-                            cache_control={"type": "ephemeral"},
+                            cache_control=_EPHEMERAL_CACHE,
                         )
                     ]
         except Exception:
@@ -406,7 +419,7 @@ class ZaiConversationEntity(
                             TextBlockParam(
                                 type="text",
                                 text=fallback_text,
-                                cache_control={"type": "ephemeral"},
+                                cache_control=_EPHEMERAL_CACHE,
                             )
                         ]
             except Exception:
@@ -414,10 +427,7 @@ class ZaiConversationEntity(
 
         # Format messages - skip SystemContent (index 0)
         messages = _convert_content(chat_log.content[1:])
-
-        # Ensure we have at least one message
-        if not messages:
-            messages = [MessageParam(role="user", content="Hello")]
+        converted_len = len(chat_log.content)
 
         # Format tools
         tools: list[ToolParam] = []
@@ -430,7 +440,8 @@ class ZaiConversationEntity(
         # Prepare API call parameters
         model_args: dict[str, Any] = {
             "model": model,
-            "messages": messages,
+            # Ensure we have at least one message
+            "messages": messages or [MessageParam(role="user", content="Hello")],
             "max_tokens": max_tokens,
             "temperature": temperature,
         }
@@ -457,6 +468,7 @@ class ZaiConversationEntity(
             if not chat_log.unresponded_tool_results:
                 break
 
-            # Add tool results and continue
-            messages = _convert_content(chat_log.content[1:])
+            # Add only the content added since the last call and continue
+            _convert_content(chat_log.content[converted_len:], messages)
+            converted_len = len(chat_log.content)
             model_args["messages"] = messages
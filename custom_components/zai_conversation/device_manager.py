@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+import io
 import logging
+from operator import itemgetter
 from typing import Any
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
@@ -130,66 +133,99 @@ SKIP_DOMAINS: set[str] = {
 }
 
 
+# Fallback translations for domains without their own entry
+_DEFAULT_STATE: dict[str, str] = {
+    "on": "ACCESO",
+    "off": "SPENTO",
+    "unavailable": "NON DISPONIBILE",
+    "unknown": "SCONOSCIUTO",
+}
+
+# (domain, state) -> translation. Domains with their own translations also
+# map the fallback states to their uppercase form, so the fallback table
+# only ever applies to domains without an entry in STATE_TRANSLATIONS.
+_FLAT_STATE: dict[tuple[str, str], str] = {
+    (domain, state): translations.get(state, state.upper())
+    for domain, translations in STATE_TRANSLATIONS.items()
+    for state in (*translations, *_DEFAULT_STATE)
+}
+
+# States hidden from the context unless include_unavailable is set
+_UNAVAILABLE_STATES: frozenset[str] = frozenset(("unavailable", "unknown"))
+
+# Sort keys for (name, entity_id, domain, state, attributes) device records
+_BY_NAME = itemgetter(0)
+_BY_DOMAIN_NAME = itemgetter(2, 0)
+
+
 def _translate_state(domain: str, state: str) -> str:
     """Translate state to human-readable format."""
-    if domain in STATE_TRANSLATIONS:
-        return STATE_TRANSLATIONS[domain].get(state, state.upper())
-    if state == "on":
-        return "ACCESO"
-    if state == "off":
-        return "SPENTO"
-    if state == "unavailable":
-        return "NON DISPONIBILE"
-    if state == "unknown":
-        return "SCONOSCIUTO"
-    return state.upper()
+    return _FLAT_STATE.get((domain, state)) or _DEFAULT_STATE.get(state) or state.upper()
+
+
+def _format_temperature(value: Any, state: State) -> str:
+    """Format a temperature using the entity's unit."""
+    unit = state.attributes.get("unit_of_measurement", "°C")
+    return f"temperatura: {value}{unit}"
+
+
+def _format_humidity(value: Any, state: State) -> str:
+    """Format a humidity percentage."""
+    return f"umidità: {value}%"
+
+
+# Formatters for attributes that need a specific rendering
+_ATTR_FORMATTERS: dict[str, Callable[[Any, State], str]] = {
+    # Convert 0-255 to percentage
+    "brightness": lambda value, state: f"luminosità: {round((value / 255) * 100)}%",
+    "color_temp": lambda value, state: f"temperatura colore: {value}K",
+    "volume_level": lambda value, state: f"volume: {round(value * 100)}%",
+    "temperature": _format_temperature,
+    "current_temperature": _format_temperature,
+    "humidity": _format_humidity,
+    "current_humidity": _format_humidity,
+    "current_position": lambda value, state: f"posizione: {value}%",
+    "battery_level": lambda value, state: f"batteria: {value}%",
+    "percentage": lambda value, state: f"velocità: {value}%",
+}
+
+# Attribute keys to render per domain. The sensor unit is skipped because
+# it is appended to the state instead.
+_DOMAIN_ATTR_KEYS: dict[str, tuple[str, ...]] = {
+    domain: tuple(
+        key for key in keys if (domain, key) != ("sensor", "unit_of_measurement")
+    )
+    for domain, keys in DOMAIN_RELEVANT_ATTRS.items()
+}
+
+
+def _format_generic(key: str, value: Any) -> str:
+    """Format an attribute without a dedicated formatter."""
+    if isinstance(value, list):
+        return f"{key}: {', '.join(str(v) for v in value[:5])}"
+    if isinstance(value, bool):
+        return f"{key}: {'sì' if value else 'no'}"
+    return f"{key}: {value}"
 
 
 def _format_attributes(domain: str, state: State) -> str:
     """Format relevant attributes for a domain."""
-    relevant_keys = DOMAIN_RELEVANT_ATTRS.get(domain, [])
+    relevant_keys = _DOMAIN_ATTR_KEYS.get(domain)
     if not relevant_keys:
         return ""
 
+    attributes = state.attributes
     attrs = []
     for key in relevant_keys:
-        if key in state.attributes:
-            value = state.attributes[key]
-            if value is None:
-                continue
-
-            # Format specific attributes
-            if key == "brightness":
-                # Convert 0-255 to percentage
-                pct = round((value / 255) * 100)
-                attrs.append(f"luminosità: {pct}%")
-            elif key == "color_temp":
-                attrs.append(f"temperatura colore: {value}K")
-            elif key == "volume_level":
-                pct = round(value * 100)
-                attrs.append(f"volume: {pct}%")
-            elif key == "temperature" or key == "current_temperature":
-                unit = state.attributes.get("unit_of_measurement", "°C")
-                attrs.append(f"temperatura: {value}{unit}")
-            elif key == "humidity" or key == "current_humidity":
-                attrs.append(f"umidità: {value}%")
-            elif key == "current_position":
-                attrs.append(f"posizione: {value}%")
-            elif key == "battery_level":
-                attrs.append(f"batteria: {value}%")
-            elif key == "percentage":
-                attrs.append(f"velocità: {value}%")
-            elif key == "unit_of_measurement" and domain == "sensor":
-                # Skip, will be used with state
-                continue
-            elif isinstance(value, list):
-                attrs.append(f"{key}: {', '.join(str(v) for v in value[:5])}")
-            elif isinstance(value, bool):
-                attrs.append(f"{key}: {'sì' if value else 'no'}")
-            else:
-                attrs.append(f"{key}: {value}")
+        value = attributes.get(key)
+        if value is None:
+            continue
+        formatter = _ATTR_FORMATTERS.get(key)
+        attrs.append(
+            formatter(value, state) if formatter else _format_generic(key, value)
+        )
 
-    return ", ".join(attrs) if attrs else ""
+    return ", ".join(attrs)
 
 
 class DeviceContextBuilder:
@@ -198,23 +234,46 @@ class DeviceContextBuilder:
     def __init__(self, hass: HomeAssistant):
         """Initialize the device context builder."""
         self.hass = hass
+        self._listening = False
+        self._areas_cache: dict[str, str] | None = None
+        self._entity_to_area_cache: dict[str, str | None] | None = None
 
-    async def build_context(
-        self,
-        area_filter: list[str] | None = None,
-        domain_filter: list[str] | None = None,
-        include_unavailable: bool = False,
-    ) -> str:
-        """Build device context string grouped by area.
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Start caching registry lookups, invalidated on registry updates.
 
-        Args:
-            area_filter: List of area IDs to include. None = all areas.
-            domain_filter: List of domains to include. None = all domains.
-            include_unavailable: Whether to include unavailable entities.
-
-        Returns:
-            Formatted string with devices grouped by area.
+        Returns a callback that stops listening and drops the cache.
         """
+        unsubs = [
+            self.hass.bus.async_listen(event_type, self._async_invalidate)
+            for event_type in (
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                ar.EVENT_AREA_REGISTRY_UPDATED,
+            )
+        ]
+        self._listening = True
+
+        @callback
+        def _async_teardown() -> None:
+            for unsub in unsubs:
+                unsub()
+            self._listening = False
+            self._async_invalidate()
+
+        return _async_teardown
+
+    @callback
+    def _async_invalidate(self, _event: Event | None = None) -> None:
+        """Drop cached registry lookups."""
+        self._areas_cache = None
+        self._entity_to_area_cache = None
+
+    def _get_area_maps(self) -> tuple[dict[str, str], dict[str, str | None]]:
+        """Return the area name and entity to area mappings."""
+        if self._areas_cache is not None and self._entity_to_area_cache is not None:
+            return self._areas_cache, self._entity_to_area_cache
+
         area_reg = ar.async_get(self.hass)
         entity_reg = er.async_get(self.hass)
         device_reg = dr.async_get(self.hass)
@@ -234,92 +293,112 @@ class DeviceContextBuilder:
                     area_id = device.area_id
             entity_to_area[entity.entity_id] = area_id
 
-        # Group entities by area
-        devices_by_area: dict[str, list[dict[str, Any]]] = {}
-        no_area_devices: list[dict[str, Any]] = []
+        # Only cache while registry updates can invalidate the result
+        if self._listening:
+            self._areas_cache = areas
+            self._entity_to_area_cache = entity_to_area
+
+        return areas, entity_to_area
+
+    async def build_context(
+        self,
+        area_filter: list[str] | None = None,
+        domain_filter: list[str] | None = None,
+        include_unavailable: bool = False,
+    ) -> str:
+        """Build device context string grouped by area.
+
+        Args:
+            area_filter: List of area IDs to include. None = all areas.
+            domain_filter: List of domains to include. None = all domains.
+            include_unavailable: Whether to include unavailable entities.
+
+        Returns:
+            Formatted string with devices grouped by area.
+        """
+        areas, entity_to_area = self._get_area_maps()
+
+        # Group entities by area as (name, entity_id, domain, state, attributes)
+        devices_by_area: dict[str, list[tuple[str, str, str, str, str]]] = {}
+        no_area_devices: list[tuple[str, str, str, str, str]] = []
+
+        # Bind hot-loop lookups to locals
+        skip_domains = SKIP_DOMAINS
+        domain_filter_set = frozenset(domain_filter) if domain_filter else None
+        area_filter_set = frozenset(area_filter) if area_filter else None
+        get_area_id = entity_to_area.get
+        translate = _translate_state
+        format_attrs = _format_attributes
+        add_to_area = devices_by_area.setdefault
+        add_no_area = no_area_devices.append
 
         for state in self.hass.states.async_all():
             entity_id = state.entity_id
-            domain = entity_id.split(".")[0]
+            domain = entity_id.partition(".")[0]
 
             # Skip unwanted domains
-            if domain in SKIP_DOMAINS:
+            if domain in skip_domains:
                 continue
 
             # Apply domain filter
-            if domain_filter and domain not in domain_filter:
+            if domain_filter_set is not None and domain not in domain_filter_set:
                 continue
 
             # Skip unavailable if not requested
-            if not include_unavailable and state.state in ("unavailable", "unknown"):
+            st = state.state
+            if not include_unavailable and st in _UNAVAILABLE_STATES:
                 continue
 
             # Get area
-            area_id = entity_to_area.get(entity_id)
+            area_id = get_area_id(entity_id)
 
             # Apply area filter
-            if area_filter and area_id not in area_filter:
+            if area_filter_set is not None and area_id not in area_filter_set:
                 continue
 
-            # Build device info
-            friendly_name = state.attributes.get("friendly_name", entity_id)
-            translated_state = _translate_state(domain, state.state)
+            # Build device info, only for entities that passed every filter
+            friendly_name = state.name
 
-            # For sensors, append unit
+            # For sensors, show the raw value with its unit
             if domain == "sensor" and "unit_of_measurement" in state.attributes:
-                translated_state = f"{state.state} {state.attributes['unit_of_measurement']}"
+                translated_state = f"{st} {state.attributes['unit_of_measurement']}"
+            else:
+                translated_state = translate(domain, st)
 
-            attrs = _format_attributes(domain, state)
+            attrs = format_attrs(domain, state)
 
-            device_info = {
-                "entity_id": entity_id,
-                "name": friendly_name,
-                "domain": domain,
-                "state": translated_state,
-                "attributes": attrs,
-            }
+            device_info = (friendly_name, entity_id, domain, translated_state, attrs)
 
             if area_id and area_id in areas:
-                area_name = areas[area_id]
-                if area_name not in devices_by_area:
-                    devices_by_area[area_name] = []
-                devices_by_area[area_name].append(device_info)
+                add_to_area(areas[area_id], []).append(device_info)
             else:
-                no_area_devices.append(device_info)
+                add_no_area(device_info)
 
         # Build output string
-        output_parts = []
-
-        # Sorted areas
-        for area_name in sorted(devices_by_area.keys()):
-            devices = devices_by_area[area_name]
-            output_parts.append(f"\n## {area_name}")
-
-            # Group by domain within area
-            by_domain: dict[str, list[dict[str, Any]]] = {}
-            for device in devices:
-                d = device["domain"]
-                if d not in by_domain:
-                    by_domain[d] = []
-                by_domain[d].append(device)
-
-            for domain in sorted(by_domain.keys()):
-                for device in sorted(by_domain[domain], key=lambda x: x["name"]):
-                    line = f"- {device['name']} ({device['entity_id']}): {device['state']}"
-                    if device["attributes"]:
-                        line += f" [{device['attributes']}]"
-                    output_parts.append(line)
+        buf = io.StringIO()
+        w = buf.write
+        sep = ""  # Blank line between sections, none before the first
+
+        # Sorted areas, devices ordered by domain then name
+        for area_name in sorted(devices_by_area):
+            w(f"{sep}\n## {area_name}")
+            sep = "\n"
+            for name, eid, _, st, at in sorted(
+                devices_by_area[area_name], key=_BY_DOMAIN_NAME
+            ):
+                w(f"\n- {name} ({eid}): {st}")
+                if at:
+                    w(f" [{at}]")
 
         # Devices without area
         if no_area_devices:
-            output_parts.append("\n## Altro (senza area)")
-            for device in sorted(no_area_devices, key=lambda x: x["name"]):
-                line = f"- {device['name']} ({device['entity_id']}): {device['state']}"
-                if device["attributes"]:
-                    line += f" [{device['attributes']}]"
-                output_parts.append(line)
+            w(f"{sep}\n## Altro (senza area)")
+            for name, eid, _, st, at in sorted(no_area_devices, key=_BY_NAME):
+                w(f"\n- {name} ({eid}): {st}")
+                if at:
+                    w(f" [{at}]")
 
-        return "\n".join(output_parts)
+        return buf.getvalue()
 
     def get_available_areas(self) -> list[dict[str, str]]:
         """Get list of available areas."""
@@ -333,7 +412,7 @@ class DeviceContextBuilder:
         """Get list of domains currently in use."""
         domains: set[str] = set()
         for state in self.hass.states.async_all():
-            domain = state.entity_id.split(".")[0]
+            domain = state.entity_id.partition(".")[0]
             if domain not in SKIP_DOMAINS:
                 domains.add(domain)
         return sorted(domains)